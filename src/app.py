@@ -5,7 +5,7 @@ A super simple FastAPI application that allows students to view and sign up
 for extracurricular activities at Mergington High School.
 """
 
-from fastapi import FastAPI, HTTPException
+from fastapi import Body, FastAPI, HTTPException
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import RedirectResponse
 import os
@@ -88,6 +88,16 @@ def get_activities():
     return activities
 
 
+@app.get("/activities/{activity_name}")
+def get_activity(activity_name: str):
+    """Get a single activity by name"""
+    # Validate activity exists
+    if activity_name not in activities:
+        raise HTTPException(status_code=404, detail="Activity not found")
+
+    return activities[activity_name]
+
+
 @app.post("/activities/{activity_name}/signup")
 def signup_for_activity(activity_name: str, email: str):
     """Sign up a student for an activity"""
@@ -107,6 +117,28 @@ def signup_for_activity(activity_name: str, email: str):
     return {"message": f"Signed up {email} for {activity_name}"}
 
 
+@app.post("/activities/{activity_name}/signup_bulk")
+def signup_bulk_for_activity(activity_name: str, emails: list[str] = Body(embed=True)):
+    """Sign up multiple students for an activity in a single request"""
+    # Validate activity exists
+    if activity_name not in activities:
+        raise HTTPException(status_code=404, detail="Activity not found")
+
+    # Get the specific activity
+    activity = activities[activity_name]
+
+    # Validate no student is already signed up or listed twice in the batch
+    seen = set()
+    for email in emails:
+        if email in activity["participants"] or email in seen:
+            raise HTTPException(status_code=400, detail="Student already signed up for this activity")
+        seen.add(email)
+
+    # Add students
+    activity["participants"].extend(emails)
+    return {"message": f"Signed up {len(emails)} students for {activity_name}"}
+
+
 @app.post("/activities/{activity_name}/unregister")
 def unregister_from_activity(activity_name: str, email: str):
     """Unregister a student from an activity"""
@@ -1,87 +1,104 @@
+import copy
 import pytest
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 # Add src directory to path so we can import app
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from fastapi.testclient import TestClient
-from app import app, activities
+
+@lru_cache(maxsize=1)
+def _build_app():
+    """Import and return the assembled FastAPI app, once per process
+
+    Deferring the import keeps conftest collection cheap and ensures each
+    xdist worker pays the FastAPI/Pydantic import cost at most once, when
+    it first builds a client.
+    """
+    from app import app
+    return app
+
+
+@lru_cache(maxsize=1)
+def _activities():
+    """Return the app's in-memory activities dict, imported on first use"""
+    from app import activities
+    return activities
+
+
+@lru_cache(maxsize=1)
+def _initial_snapshot():
+    """Snapshot the pristine in-memory database before any test mutates it"""
+    return copy.deepcopy(_activities())
+
+
+def _iter_signup_cases():
+    """Yield (activity, email) signup cases one at a time"""
+    yield "Basketball Team", "student@mergington.edu"
+    yield "Soccer Club", "alice@mergington.edu"
+    yield "Debate Team", "student1@mergington.edu"
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize signup cases lazily instead of listing them at the test"""
+    if "signup_case" in metafunc.fixturenames:
+        metafunc.parametrize("signup_case", list(_iter_signup_cases()), indirect=True)
 
 
 @pytest.fixture
+def signup_case(request):
+    """Hand one (activity, email) signup case to the test"""
+    return request.param
+
+
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client for the FastAPI app"""
-    return TestClient(app)
+    """Create a single test client shared by the whole test session
+
+    TestClient is an httpx.Client bound to one in-process ASGI transport,
+    so every request in the session reuses the same pooled connection
+    instead of rebuilding the transport per call.
+    """
+    from fastapi.testclient import TestClient
+    with TestClient(_build_app()) as c:
+        yield c
+
+
+@pytest.fixture
+def store():
+    """Expose the app's in-memory activities store for white-box checks
+
+    The app has no file or database persistence to bypass - activities
+    lives in a plain module-level dict - so tests are already free of
+    storage I/O. This fixture just hands that dict to tests that want to
+    inspect state without an HTTP round-trip.
+    """
+    return _activities()
+
+
+@pytest.fixture(scope="session")
+def initial_activities(client):
+    """Fetch the unmodified activities once and share the parsed response
+
+    Read-only tests can consume this instead of re-issuing the same GET
+    and re-decoding the same JSON payload.
+    """
+    response = client.get("/activities")
+    assert response.status_code == 200
+    return response.json()
 
 
 @pytest.fixture(autouse=True)
 def reset_activities():
-    """Reset activities to initial state before each test"""
-    # Store original state
-    original_activities = {
-        "Chess Club": {
-            "description": "Learn strategies and compete in chess tournaments",
-            "schedule": "Fridays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": ["michael@mergington.edu", "daniel@mergington.edu"]
-        },
-        "Programming Class": {
-            "description": "Learn programming fundamentals and build software projects",
-            "schedule": "Tuesdays and Thursdays, 3:30 PM - 4:30 PM",
-            "max_participants": 20,
-            "participants": ["emma@mergington.edu", "sophia@mergington.edu"]
-        },
-        "Gym Class": {
-            "description": "Physical education and sports activities",
-            "schedule": "Mondays, Wednesdays, Fridays, 2:00 PM - 3:00 PM",
-            "max_participants": 30,
-            "participants": ["john@mergington.edu", "olivia@mergington.edu"]
-        },
-        "Basketball Team": {
-            "description": "Join the basketball team and compete in local tournaments",
-            "schedule": "Mondays and Wednesdays, 4:00 PM - 6:00 PM",
-            "max_participants": 15,
-            "participants": []
-        },
-        "Soccer Club": {
-            "description": "Practice soccer skills and participate in matches",
-            "schedule": "Tuesdays and Thursdays, 5:00 PM - 7:00 PM",
-            "max_participants": 20,
-            "participants": []
-        },
-        "Art Club": {
-            "description": "Explore various art techniques and create projects",
-            "schedule": "Fridays, 3:00 PM - 5:00 PM",
-            "max_participants": 10,
-            "participants": []
-        },
-        "Drama Club": {
-            "description": "Participate in theater productions and improve acting skills",
-            "schedule": "Thursdays, 4:00 PM - 6:00 PM",
-            "max_participants": 25,
-            "participants": []
-        },
-        "Debate Team": {
-            "description": "Engage in debates and improve public speaking skills",
-            "schedule": "Wednesdays, 3:30 PM - 5:00 PM",
-            "max_participants": 12,
-            "participants": []
-        },
-        "Math Club": {
-            "description": "Solve challenging math problems and participate in competitions",
-            "schedule": "Tuesdays, 3:00 PM - 4:30 PM",
-            "max_participants": 15,
-            "participants": []
-        }
-    }
-    
-    # Clear and reset
+    """Reset activities to initial state around each test"""
+    activities = _activities()
+    snapshot = _initial_snapshot()
+
     activities.clear()
-    activities.update(original_activities)
-    
+    activities.update(copy.deepcopy(snapshot))
+
     yield
-    
-    # Reset after test
+
     activities.clear()
-    activities.update(original_activities)
+    activities.update(copy.deepcopy(snapshot))
@@ -2,77 +2,81 @@
 
 import pytest
 
+ACTIVITIES_URL = "/activities"
+CHESS_CLUB = "Chess Club"
+MICHAEL = "michael@mergington.edu"
+DANIEL = "daniel@mergington.edu"
+
 
 class TestGetActivities:
     """Test the GET /activities endpoint"""
     
-    def test_get_activities_returns_all_activities(self, client):
+    def test_get_activities_returns_all_activities(self, initial_activities):
         """Test that we can retrieve all activities"""
-        response = client.get("/activities")
-        assert response.status_code == 200
-        data = response.json()
-        
+        data = initial_activities
+
         # Check that we have the expected activities
         assert "Chess Club" in data
         assert "Programming Class" in data
         assert "Basketball Team" in data
         assert len(data) == 9
-    
-    def test_activity_structure(self, client):
+
+    def test_activity_structure(self, initial_activities):
         """Test that activities have the correct structure"""
-        response = client.get("/activities")
-        data = response.json()
-        
-        activity = data["Chess Club"]
+        activity = initial_activities[CHESS_CLUB]
         assert "description" in activity
         assert "schedule" in activity
         assert "max_participants" in activity
         assert "participants" in activity
         assert isinstance(activity["participants"], list)
     
-    def test_activities_contain_participants(self, client):
-        """Test that activities with participants show them correctly"""
-        response = client.get("/activities")
+    def test_get_single_activity(self, client):
+        """Test that a single activity can be retrieved by name"""
+        response = client.get(f"{ACTIVITIES_URL}/{CHESS_CLUB}")
+        assert response.status_code == 200
         data = response.json()
-        
-        chess_club = data["Chess Club"]
-        assert len(chess_club["participants"]) == 2
-        assert "michael@mergington.edu" in chess_club["participants"]
-        assert "daniel@mergington.edu" in chess_club["participants"]
+        assert data["max_participants"] == 12
+        assert MICHAEL in data["participants"]
+
+    def test_get_nonexistent_activity(self, client):
+        """Test that requesting a nonexistent activity returns 404"""
+        response = client.get(f"{ACTIVITIES_URL}/Nonexistent Club")
+        assert response.status_code == 404
+        assert "Activity not found" in response.json()["detail"]
+
+    def test_activities_contain_participants(self, initial_activities):
+        """Test that activities with participants show them correctly"""
+        participants = set(initial_activities[CHESS_CLUB]["participants"])
+        assert len(participants) == 2
+        assert MICHAEL in participants
+        assert DANIEL in participants
 
 
 class TestSignupEndpoint:
     """Test the POST /activities/{activity_name}/signup endpoint"""
     
-    def test_signup_new_participant(self, client):
-        """Test signing up a new participant for an activity"""
+    def test_signup_adds_participant(self, client, signup_case):
+        """Test that signup succeeds and adds the participant to the activity"""
+        activity, email = signup_case
         response = client.post(
-            "/activities/Basketball%20Team/signup",
-            params={"email": "student@mergington.edu"}
+            f"{ACTIVITIES_URL}/{activity}/signup",
+            params={"email": email}
         )
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
-        assert "student@mergington.edu" in data["message"]
-        assert "Basketball Team" in data["message"]
-    
-    def test_signup_adds_participant_to_activity(self, client):
-        """Test that signup actually adds the participant to the activity"""
-        # First signup
-        client.post(
-            "/activities/Soccer%20Club/signup",
-            params={"email": "alice@mergington.edu"}
-        )
-        
+        assert email in data["message"]
+        assert activity in data["message"]
+
         # Verify participant was added
-        response = client.get("/activities")
+        response = client.get(ACTIVITIES_URL)
         activities = response.json()
-        assert "alice@mergington.edu" in activities["Soccer Club"]["participants"]
+        assert email in activities[activity]["participants"]
     
     def test_signup_nonexistent_activity(self, client):
         """Test that signing up for a nonexistent activity returns 404"""
         response = client.post(
-            "/activities/Nonexistent%20Club/signup",
+            f"{ACTIVITIES_URL}/Nonexistent Club/signup",
             params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
@@ -82,60 +86,81 @@ class TestSignupEndpoint:
         """Test that a participant cannot sign up twice for the same activity"""
         # First signup
         client.post(
-            "/activities/Art%20Club/signup",
+            f"{ACTIVITIES_URL}/Art Club/signup",
             params={"email": "duplicate@mergington.edu"}
         )
         
         # Try to signup again
         response = client.post(
-            "/activities/Art%20Club/signup",
+            f"{ACTIVITIES_URL}/Art Club/signup",
             params={"email": "duplicate@mergington.edu"}
         )
         assert response.status_code == 400
         assert "already signed up" in response.json()["detail"]
-    
-    def test_signup_already_registered_participant(self, client):
-        """Test that an already registered participant cannot sign up again"""
+
+    def test_signup_bulk_nonexistent_activity(self, client):
+        """Test that bulk signup for a nonexistent activity returns 404"""
+        response = client.post(
+            f"{ACTIVITIES_URL}/Nonexistent Club/signup_bulk",
+            json={"emails": ["student@mergington.edu"]}
+        )
+        assert response.status_code == 404
+        assert "Activity not found" in response.json()["detail"]
+
+    def test_signup_bulk_already_signed_up(self, client, store):
+        """Test that bulk signup rejects an already registered participant"""
         response = client.post(
-            "/activities/Chess%20Club/signup",
-            params={"email": "michael@mergington.edu"}
+            f"{ACTIVITIES_URL}/{CHESS_CLUB}/signup_bulk",
+            json={"emails": ["new@mergington.edu", MICHAEL]}
         )
         assert response.status_code == 400
         assert "already signed up" in response.json()["detail"]
 
+        # Verify nothing was added before the rejection
+        assert "new@mergington.edu" not in store[CHESS_CLUB]["participants"]
+
+    def test_signup_bulk_duplicate_in_batch(self, client, store):
+        """Test that bulk signup rejects the same email listed twice"""
+        email = "dup@mergington.edu"
+        response = client.post(
+            f"{ACTIVITIES_URL}/Art Club/signup_bulk",
+            json={"emails": [email, email]}
+        )
+        assert response.status_code == 400
+        assert "already signed up" in response.json()["detail"]
+
+        # Verify the duplicate batch left no entries behind
+        assert email not in store["Art Club"]["participants"]
+
 
 class TestUnregisterEndpoint:
     """Test the POST /activities/{activity_name}/unregister endpoint"""
     
-    def test_unregister_existing_participant(self, client):
-        """Test unregistering an existing participant"""
+    @pytest.mark.parametrize("email", [
+        MICHAEL,
+        DANIEL,
+    ])
+    def test_unregister_removes_participant(self, client, email):
+        """Test that unregister succeeds and removes the participant"""
         response = client.post(
-            "/activities/Chess%20Club/unregister",
-            params={"email": "michael@mergington.edu"}
+            f"{ACTIVITIES_URL}/{CHESS_CLUB}/unregister",
+            params={"email": email}
         )
         assert response.status_code == 200
         data = response.json()
         assert "message" in data
         assert "Unregistered" in data["message"]
-    
-    def test_unregister_removes_participant(self, client):
-        """Test that unregister actually removes the participant"""
-        # First unregister
-        client.post(
-            "/activities/Chess%20Club/unregister",
-            params={"email": "daniel@mergington.edu"}
-        )
-        
+
         # Verify participant was removed
-        response = client.get("/activities")
-        activities = response.json()
-        assert "daniel@mergington.edu" not in activities["Chess Club"]["participants"]
-        assert len(activities["Chess Club"]["participants"]) == 1
+        response = client.get(ACTIVITIES_URL)
+        participants = response.json()[CHESS_CLUB]["participants"]
+        assert email not in participants
+        assert len(participants) == 1
     
     def test_unregister_nonexistent_activity(self, client):
         """Test that unregistering from a nonexistent activity returns 404"""
         response = client.post(
-            "/activities/Nonexistent%20Club/unregister",
+            f"{ACTIVITIES_URL}/Nonexistent Club/unregister",
             params={"email": "student@mergington.edu"}
         )
         assert response.status_code == 404
@@ -144,7 +169,7 @@ class TestUnregisterEndpoint:
     def test_unregister_nonexistent_participant(self, client):
         """Test that unregistering a non-registered participant returns 400"""
         response = client.post(
-            "/activities/Basketball%20Team/unregister",
+            f"{ACTIVITIES_URL}/Basketball Team/unregister",
             params={"email": "notregistered@mergington.edu"}
         )
         assert response.status_code == 400
@@ -152,76 +177,72 @@ class TestUnregisterEndpoint:
     
     def test_unregister_and_signup_again(self, client):
         """Test that a participant can sign up again after unregistering"""
-        email = "michael@mergington.edu"
+        email = MICHAEL
         
         # Unregister
         client.post(
-            "/activities/Chess%20Club/unregister",
+            f"{ACTIVITIES_URL}/{CHESS_CLUB}/unregister",
             params={"email": email}
         )
         
         # Signup again
         response = client.post(
-            "/activities/Chess%20Club/signup",
+            f"{ACTIVITIES_URL}/{CHESS_CLUB}/signup",
             params={"email": email}
         )
         assert response.status_code == 200
         
         # Verify they're registered again
-        activities_response = client.get("/activities")
+        activities_response = client.get(ACTIVITIES_URL)
         activities = activities_response.json()
-        assert email in activities["Chess Club"]["participants"]
+        assert email in activities[CHESS_CLUB]["participants"]
 
 
 class TestIntegration:
     """Integration tests for multiple operations"""
     
-    def test_signup_and_unregister_flow(self, client):
+    def test_signup_and_unregister_flow(self, client, store):
         """Test a complete signup and unregister flow"""
         email = "newstudent@mergington.edu"
-        activity = "Drama%20Club"
-        
+        activity = "Drama Club"
+
         # Initial check - not registered
-        response = client.get("/activities")
-        assert email not in response.json()["Drama Club"]["participants"]
-        
+        assert email not in store[activity]["participants"]
+
         # Sign up
         signup_response = client.post(
-            f"/activities/{activity}/signup",
+            f"{ACTIVITIES_URL}/{activity}/signup",
             params={"email": email}
         )
         assert signup_response.status_code == 200
-        
+
         # Verify registered
-        response = client.get("/activities")
-        assert email in response.json()["Drama Club"]["participants"]
-        
+        assert email in store[activity]["participants"]
+
         # Unregister
         unregister_response = client.post(
-            f"/activities/{activity}/unregister",
+            f"{ACTIVITIES_URL}/{activity}/unregister",
             params={"email": email}
         )
         assert unregister_response.status_code == 200
-        
+
         # Verify unregistered
-        response = client.get("/activities")
-        assert email not in response.json()["Drama Club"]["participants"]
+        assert email not in store[activity]["participants"]
     
     def test_multiple_participants_signup(self, client):
         """Test that multiple participants can sign up for an activity"""
-        activity = "Debate%20Team"
+        activity = "Debate Team"
         emails = ["student1@mergington.edu", "student2@mergington.edu", "student3@mergington.edu"]
-        
-        # Sign up all students
-        for email in emails:
-            response = client.post(
-                f"/activities/{activity}/signup",
-                params={"email": email}
-            )
-            assert response.status_code == 200
-        
+
+        # Sign up all students in one request
+        response = client.post(
+            f"{ACTIVITIES_URL}/{activity}/signup_bulk",
+            json={"emails": emails}
+        )
+        assert response.status_code == 200
+
         # Verify all are registered
-        response = client.get("/activities")
-        activities = response.json()
+        response = client.get(ACTIVITIES_URL)
+        participants = set(response.json()["Debate Team"]["participants"])
         for email in emails:
-            assert email in activities["Debate Team"]["participants"]
+            assert email in participants